@@ -18,10 +18,13 @@ import asyncio
 import logging
 import os
 import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import ClassVar
 from uuid import uuid4
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from transcript_parser import parse_podcast_messages
 
 from graphiti_core import Graphiti
@@ -58,7 +61,17 @@ def setup_logging():
     return logger
 
 
-class Person(BaseModel):
+class OntologyModel(BaseModel):
+    """Base for the custom entity and edge types used in this example.
+
+    Core schemas are built on first use rather than at import, so types that never
+    reach an LLM call cost nothing at startup.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class Person(OntologyModel):
     """A human person, fictional or nonfictional."""
 
     first_name: str | None = Field(..., description='First name')
@@ -66,23 +79,73 @@ class Person(BaseModel):
     occupation: str | None = Field(..., description="The person's work occupation")
 
 
-class City(BaseModel):
+class City(OntologyModel):
     """A city"""
 
     country: str | None = Field(..., description='The country the city is in')
 
 
-class IsPresidentOf(BaseModel):
+class OntologyEdge(OntologyModel):
+    """Base for edge types, declaring the node type pairs each edge may connect.
+
+    An edge applies to every (source, target) combination of `source_types` and `target_types`.
+    """
+
+    source_types: ClassVar[tuple[str, ...]] = ('Entity',)
+    target_types: ClassVar[tuple[str, ...]] = ('Entity',)
+
+
+class IsPresidentOf(OntologyEdge):
     """Relationship between a person and the entity they are a president of"""
 
+    source_types = ('Person',)
+    target_types = ('Entity',)
 
-class InterpersonalRelationship(BaseModel):
+
+class InterpersonalRelationship(OntologyEdge):
     """A relationship between two people (e.g., knows, works with, interviewed)"""
 
+    source_types = ('Person',)
+    target_types = ('Person', 'Entity')
+
 
-class LocatedIn(BaseModel):
+class LocatedIn(OntologyEdge):
     """A relationship indicating something is located in or associated with a place"""
 
+    source_types = ('Person', 'Entity')
+    target_types = ('City',)
+
+
+def build_edge_type_map(
+    edge_types: Mapping[str, type[OntologyEdge]],
+) -> Mapping[tuple[str, str], tuple[str, ...]]:
+    """Build a frozen edge type map from the signatures declared on each edge type."""
+    edge_type_map: dict[tuple[str, str], list[str]] = {}
+    for edge_type_name, edge_type in edge_types.items():
+        for source_type in edge_type.source_types:
+            for target_type in edge_type.target_types:
+                edge_type_map.setdefault((source_type, target_type), []).append(edge_type_name)
+
+    return MappingProxyType(
+        {signature: tuple(type_names) for signature, type_names in edge_type_map.items()}
+    )
+
+
+ENTITY_TYPES = {'Person': Person, 'City': City}
+
+# Define edge types - note that some edge types are reused across multiple node type pairs
+# This tests the fix for preserving all signatures when edge types are shared
+EDGE_TYPES = {
+    'IS_PRESIDENT_OF': IsPresidentOf,
+    'INTERPERSONAL_RELATIONSHIP': InterpersonalRelationship,
+    'LOCATED_IN': LocatedIn,
+}
+
+# Edge type map with shared edge types across multiple node type pairs:
+# - INTERPERSONAL_RELATIONSHIP is used for both (Person, Person) and (Person, Entity)
+# - LOCATED_IN is used for both (Person, City) and (Entity, City)
+EDGE_TYPE_MAP = build_edge_type_map(EDGE_TYPES)
+
 
 async def main(use_bulk: bool = False):
     setup_logging()
@@ -108,31 +171,13 @@ async def main(use_bulk: bool = False):
                 source_description='Podcast Transcript',
             )
         )
-    # Define edge types - note that some edge types are reused across multiple node type pairs
-    # This tests the fix for preserving all signatures when edge types are shared
-    edge_types = {
-        'IS_PRESIDENT_OF': IsPresidentOf,
-        'INTERPERSONAL_RELATIONSHIP': InterpersonalRelationship,
-        'LOCATED_IN': LocatedIn,
-    }
-
-    # Edge type map with shared edge types across multiple node type pairs:
-    # - INTERPERSONAL_RELATIONSHIP is used for both (Person, Person) and (Person, Entity)
-    # - LOCATED_IN is used for both (Person, City) and (Entity, City)
-    edge_type_map = {
-        ('Person', 'Entity'): ['IS_PRESIDENT_OF', 'INTERPERSONAL_RELATIONSHIP'],
-        ('Person', 'Person'): ['INTERPERSONAL_RELATIONSHIP'],  # Same type, different signature
-        ('Person', 'City'): ['LOCATED_IN'],
-        ('Entity', 'City'): ['LOCATED_IN'],  # Same type, different signature
-    }
-
     if use_bulk:
         await client.add_episode_bulk(
             raw_episodes,
             group_id=group_id,
-            entity_types={'Person': Person, 'City': City},
-            edge_types=edge_types,
-            edge_type_map=edge_type_map,
+            entity_types=ENTITY_TYPES,
+            edge_types=EDGE_TYPES,
+            edge_type_map=EDGE_TYPE_MAP,
             saga='Freakonomics Podcast',
         )
     else:
@@ -148,9 +193,9 @@ async def main(use_bulk: bool = False):
                 reference_time=message.actual_timestamp,
                 source_description='Podcast Transcript',
                 group_id=group_id,
-                entity_types={'Person': Person, 'City': City},
-                edge_types=edge_types,
-                edge_type_map=edge_type_map,
+                entity_types=ENTITY_TYPES,
+                edge_types=EDGE_TYPES,
+                edge_type_map=EDGE_TYPE_MAP,
                 previous_episode_uuids=episode_uuids,
                 saga='Freakonomics Podcast',
             )
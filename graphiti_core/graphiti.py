@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import Collection, Mapping
 from datetime import datetime
 from time import time
 from uuid import uuid4
@@ -451,7 +452,7 @@ class Graphiti:
         episode: EpisodicNode,
         extracted_nodes: list[EntityNode],
         previous_episodes: list[EpisodicNode],
-        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_type_map: Mapping[tuple[str, str], Collection[str]],
         group_id: str,
         edge_types: dict[str, type[BaseModel]] | None,
         nodes: list[EntityNode],
@@ -591,7 +592,7 @@ class Graphiti:
     async def _extract_and_dedupe_nodes_bulk(
         self,
         episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
-        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_type_map: Mapping[tuple[str, str], Collection[str]],
         edge_types: dict[str, type[BaseModel]] | None,
         entity_types: dict[str, type[BaseModel]] | None,
         excluded_entity_types: list[str] | None,
@@ -627,7 +628,7 @@ class Graphiti:
         episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
         entity_types: dict[str, type[BaseModel]] | None,
         edge_types: dict[str, type[BaseModel]] | None,
-        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_type_map: Mapping[tuple[str, str], Collection[str]],
         episodes: list[EpisodicNode],
     ) -> tuple[list[EntityNode], list[EntityEdge], list[EntityEdge], dict[str, str]]:
         """Resolve nodes and edges against the existing graph."""
@@ -799,7 +800,7 @@ class Graphiti:
         excluded_entity_types: list[str] | None = None,
         previous_episode_uuids: list[str] | None = None,
         edge_types: dict[str, type[BaseModel]] | None = None,
-        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        edge_type_map: Mapping[tuple[str, str], Collection[str]] | None = None,
         custom_extraction_instructions: str | None = None,
         saga: str | SagaNode | None = None,
         saga_previous_episode_uuid: str | None = None,
@@ -1041,7 +1042,7 @@ class Graphiti:
         entity_types: dict[str, type[BaseModel]] | None = None,
         excluded_entity_types: list[str] | None = None,
         edge_types: dict[str, type[BaseModel]] | None = None,
-        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        edge_type_map: Mapping[tuple[str, str], Collection[str]] | None = None,
         custom_extraction_instructions: str | None = None,
         saga: str | SagaNode | None = None,
     ) -> AddBulkEpisodeResults:
@@ -1063,7 +1064,7 @@ class Graphiti:
             Optional. A list of entity type names to exclude from extraction.
         edge_types : dict[str, type[BaseModel]] | None
             Optional. A dictionary mapping edge type names to Pydantic models.
-        edge_type_map : dict[tuple[str, str], list[str]] | None
+        edge_type_map : Mapping[tuple[str, str], Collection[str]] | None
             Optional. A mapping of (source_type, target_type) to allowed edge types.
         custom_extraction_instructions : str | None
             Optional. Custom extraction instructions string to be included in the
@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import BaseModel, ValidationError
 
 from ..prompts.models import Message
-from .client import LLMClient
+from .client import LLMClient, get_response_model_schema
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
 
@@ -188,7 +188,7 @@ class AnthropicClient(LLMClient):
         """
         if response_model is not None:
             # Use the response_model to define the tool
-            model_schema = response_model.model_json_schema()
+            model_schema = json.loads(get_response_model_schema(response_model))
             tool_name = response_model.__name__
             description = model_schema.get('description', f'Extract {tool_name} information')
         else:
@@ -19,6 +19,7 @@ import json
 import logging
 import typing
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 import httpx
 from diskcache import Cache
@@ -59,6 +60,16 @@ def get_extraction_language_instruction(group_id: str | None = None) -> str:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def get_response_model_schema(response_model: type[BaseModel]) -> str:
+    """Returns the serialized JSON schema for a response model.
+
+    Schemas are rendered once per model class and reused, since the same prompt response models
+    and custom entity/edge types are sent with every LLM call.
+    """
+    return json.dumps(response_model.model_json_schema())
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -165,7 +176,7 @@ class LLMClient(ABC):
             max_tokens = self.max_tokens
 
         if response_model is not None:
-            serialized_model = json.dumps(response_model.model_json_schema())
+            serialized_model = get_response_model_schema(response_model)
             messages[
                 -1
             ].content += (
@@ -23,7 +23,7 @@ from typing import TYPE_CHECKING, ClassVar
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient, get_extraction_language_instruction, get_response_model_schema
 from .config import LLMConfig, ModelSize
 from .errors import RateLimitError
 
@@ -262,11 +262,11 @@ class GeminiClient(LLMClient):
             system_prompt = ''
             if response_model is not None:
                 # Get the schema from the Pydantic model
-                pydantic_schema = response_model.model_json_schema()
+                pydantic_schema = get_response_model_schema(response_model)
 
                 # Create instruction to output in the desired JSON format
                 system_prompt += (
-                    f'Output ONLY valid JSON matching this schema: {json.dumps(pydantic_schema)}.\n'
+                    f'Output ONLY valid JSON matching this schema: {pydantic_schema}.\n'
                     'Do not include any explanatory text before or after the JSON.\n\n'
                 )
 
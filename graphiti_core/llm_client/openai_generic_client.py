@@ -25,7 +25,7 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient, get_extraction_language_instruction, get_response_model_schema
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
 
@@ -111,7 +111,7 @@ class OpenAIGenericClient(LLMClient):
             response_format: dict[str, Any] = {'type': 'json_object'}
             if response_model is not None:
                 schema_name = getattr(response_model, '__name__', 'structured_response')
-                json_schema = response_model.model_json_schema()
+                json_schema = json.loads(get_response_model_schema(response_model))
                 response_format = {
                     'type': 'json_schema',
                     'json_schema': {
@@ -17,6 +17,7 @@ limitations under the License.
 import json
 import logging
 import typing
+from collections.abc import Collection, Mapping
 from datetime import datetime
 
 import numpy as np
@@ -254,7 +255,7 @@ async def add_nodes_and_edges_bulk_tx(
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
-    edge_type_map: dict[tuple[str, str], list[str]],
+    edge_type_map: Mapping[tuple[str, str], Collection[str]],
     entity_types: dict[str, type[BaseModel]] | None = None,
     excluded_entity_types: list[str] | None = None,
     edge_types: dict[str, type[BaseModel]] | None = None,
@@ -414,7 +415,7 @@ async def dedupe_edges_bulk(
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
     _entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
-    _edge_type_map: dict[tuple[str, str], list[str]],
+    _edge_type_map: Mapping[tuple[str, str], Collection[str]],
 ) -> dict[str, list[EntityEdge]]:
     embedder = clients.embedder
     min_score = 0.6
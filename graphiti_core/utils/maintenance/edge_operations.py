@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import Collection, Mapping
 from datetime import datetime
 from time import time
 
@@ -90,7 +91,7 @@ async def extract_edges(
     episode: EpisodicNode,
     nodes: list[EntityNode],
     previous_episodes: list[EpisodicNode],
-    edge_type_map: dict[tuple[str, str], list[str]],
+    edge_type_map: Mapping[tuple[str, str], Collection[str]],
     group_id: str = '',
     edge_types: dict[str, type[BaseModel]] | None = None,
     custom_extraction_instructions: str | None = None,
@@ -234,13 +235,34 @@ async def extract_edges(
     return edges
 
 
+def _index_edge_types_by_signature(
+    edge_type_map: Mapping[tuple[str, str], Collection[str]],
+    edge_types: dict[str, type[BaseModel]],
+) -> dict[str, dict[str, dict[str, type[BaseModel]]]]:
+    """Index edge type models by source label, then target label.
+
+    Built once per batch so each extracted edge only probes labels that appear in the map,
+    rather than building and looking up every (source, target) label pair. Edge type names
+    without a model in `edge_types` are dropped here.
+    """
+    index: dict[str, dict[str, dict[str, type[BaseModel]]]] = {}
+    for (source_label, target_label), type_names in edge_type_map.items():
+        type_models = index.setdefault(source_label, {}).setdefault(target_label, {})
+        for type_name in type_names:
+            type_model = edge_types.get(type_name)
+            if type_model is not None:
+                type_models[type_name] = type_model
+
+    return index
+
+
 async def resolve_extracted_edges(
     clients: GraphitiClients,
     extracted_edges: list[EntityEdge],
     episode: EpisodicNode,
     entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
-    edge_type_map: dict[tuple[str, str], list[str]],
+    edge_type_map: Mapping[tuple[str, str], Collection[str]],
 ) -> tuple[list[EntityEdge], list[EntityEdge], list[EntityEdge]]:
     """Resolve extracted edges against existing graph context.
 
@@ -344,6 +366,7 @@ async def resolve_extracted_edges(
     # Determine which edge types are relevant for each edge based on node signatures.
     # `edge_types_lst` stores the subset of custom edge definitions whose
     # node signature matches each extracted edge.
+    signature_index = _index_edge_types_by_signature(edge_type_map, edge_types)
     edge_types_lst: list[dict[str, type[BaseModel]]] = []
     for extracted_edge in extracted_edges:
         source_node = uuid_entity_map.get(extracted_edge.source_node_uuid)
@@ -354,21 +377,14 @@ async def resolve_extracted_edges(
         target_node_labels = (
             target_node.labels + ['Entity'] if target_node is not None else ['Entity']
         )
-        label_tuples = [
-            (source_label, target_label)
-            for source_label in source_node_labels
-            for target_label in target_node_labels
-        ]
-
-        extracted_edge_types = {}
-        for label_tuple in label_tuples:
-            type_names = edge_type_map.get(label_tuple, [])
-            for type_name in type_names:
-                type_model = edge_types.get(type_name)
-                if type_model is None:
-                    continue
 
-                extracted_edge_types[type_name] = type_model
+        extracted_edge_types: dict[str, type[BaseModel]] = {}
+        for source_label in source_node_labels:
+            types_by_target = signature_index.get(source_label)
+            if types_by_target is None:
+                continue
+            for target_label in target_node_labels:
+                extracted_edge_types.update(types_by_target.get(target_label, {}))
 
         edge_types_lst.append(extracted_edge_types)
 
@@ -14,7 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from graphiti_core.llm_client.client import LLMClient
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.client import LLMClient, get_response_model_schema
 from graphiti_core.llm_client.config import LLMConfig
 
 
@@ -55,3 +59,21 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+class SchemaModel(BaseModel):
+    name: str
+
+
+def test_get_response_model_schema_renders_once_per_model():
+    get_response_model_schema.cache_clear()
+
+    with patch.object(
+        SchemaModel, 'model_json_schema', wraps=SchemaModel.model_json_schema
+    ) as schema_spy:
+        first = get_response_model_schema(SchemaModel)
+        second = get_response_model_schema(SchemaModel)
+
+    assert first == second
+    assert '"name"' in first
+    assert schema_spy.call_count == 1
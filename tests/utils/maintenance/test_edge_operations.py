@@ -557,3 +557,41 @@ def test_edge_type_signatures_map_single_signature_still_works():
         assert 'fact_type_signatures' in ctx
         assert isinstance(ctx['fact_type_signatures'], list)
         assert len(ctx['fact_type_signatures']) == 1
+
+
+def test_index_edge_types_by_signature_groups_by_source_then_target():
+    """Test that the signature index nests models by label pair and drops unknown names."""
+    from graphiti_core.utils.maintenance.edge_operations import _index_edge_types_by_signature
+
+    edge_type_map: dict[tuple[str, str], list[str]] = {
+        ('Person', 'Person'): ['InterpersonalRelationship'],
+        ('Person', 'City'): ['LocatedIn', 'Unknown'],
+        ('Entity', 'City'): ['LocatedIn'],
+    }
+
+    edge_types: dict[str, type[BaseModel]] = {
+        'InterpersonalRelationship': InterpersonalRelationship,
+        'LocatedIn': LocatedIn,
+    }
+
+    index = _index_edge_types_by_signature(edge_type_map, edge_types)
+
+    assert index == {
+        'Person': {
+            'Person': {'InterpersonalRelationship': InterpersonalRelationship},
+            'City': {'LocatedIn': LocatedIn},
+        },
+        'Entity': {'City': {'LocatedIn': LocatedIn}},
+    }
+
+
+def test_index_edge_types_by_signature_accepts_frozenset_values():
+    """Test that edge type names may be given as any collection, not only lists."""
+    from graphiti_core.utils.maintenance.edge_operations import _index_edge_types_by_signature
+
+    edge_type_map = {('Person', 'City'): frozenset({'LocatedIn', 'Unknown'})}
+    edge_types: dict[str, type[BaseModel]] = {'LocatedIn': LocatedIn}
+
+    index = _index_edge_types_by_signature(edge_type_map, edge_types)
+
+    assert index == {'Person': {'City': {'LocatedIn': LocatedIn}}}